@@ -6,46 +6,188 @@ This script recursively copies the content of all readable text files
 in the specified folder to the clipboard using the Windows "clip" command.
 """
 
+import codecs
 import os
 import subprocess
 import sys
 
-
-def is_text_file(file_path):
+# Files with these extensions are known to be binary and are skipped without being read.
+BINARY_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp",
+    ".mp3", ".mp4", ".mov", ".avi", ".mkv", ".wav",
+    ".zip", ".gz", ".xz", ".bz2", ".7z", ".tar",
+    ".pdf", ".so", ".dll", ".exe", ".pyc", ".o", ".a",
+})
+# Larger files are skipped as well; they are not sensible clipboard content.
+MAX_FILE_SIZE = 16 * 1024 * 1024
+# Only the start of a file is probed for null bytes. Content with null bytes is
+# considered binary, unless they make up at most 1 / MAX_NULL_RATIO_INVERSE (5%)
+# of the probe and the rest of the probe is valid UTF-8 without control bytes.
+TEXT_PROBE_SIZE = 8192
+MAX_NULL_RATIO_INVERSE = 20
+UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+# Bytes removed when counting control bytes: everything except the C0 controls
+# (other than whitespace, backspace and escape) and DEL. Null bytes are counted separately.
+TEXT_BYTES = bytes([0, 8, 9, 10, 11, 12, 13, 27]) + bytes(range(0x20, 0x7F)) + bytes(range(0x80, 0x100))
+
+# Windows clip expects Unicode text as UTF-16; constant pieces are encoded once.
+CLIP_ENCODING = "utf-16-le"
+NEWLINE = "\n".encode(CLIP_ENCODING)
+TWO_NEWLINES = NEWLINE * 2
+
+
+def is_text_data(data):
     """
-    Check whether a file is a text file.
+    Check whether the raw content of a file looks like text.
 
-    An empty file is considered a text file.
-    For non-empty files, this function reads the first chunk of the file in binary mode
-    and checks for null bytes. If a null byte is found, the file is considered binary.
+    Empty content and content starting with a UTF-16 BOM are considered text, as
+    is content without null bytes in the first chunk. Text with occasional stray
+    nulls is still copied: a chunk with nulls is considered text if at most 5% of
+    it are null bytes and the rest is valid UTF-8 without control bytes. Compressed
+    and other binary data fails the second test even when it has few nulls.
 
     Args:
-        file_path (str): The path to the file.
+        data (bytes): The raw file content.
 
     Returns:
-        bool: True if the file is empty or is likely a text file; False otherwise.
+        bool: True if the content is empty or is likely text; False otherwise.
     """
+    if data.startswith(UTF16_BOMS):
+        return True
+    probe_len = min(len(data), TEXT_PROBE_SIZE)
+    # Bounded count avoids copying the probe region into a new bytes object.
+    nulls = data.count(b"\0", 0, probe_len)
+    if nulls == 0:
+        return True
+    if nulls * MAX_NULL_RATIO_INVERSE > probe_len:
+        return False
+    probe = data[:probe_len]
+    if probe.translate(None, TEXT_BYTES):
+        return False
     try:
-        if os.path.getsize(file_path) == 0:
-            return True
-        with open(file_path, "rb") as f:
-            chunk = f.read(1024)
-            if b"\0" in chunk:
-                return False
-    except Exception:
+        # Incremental decode tolerates a multi-byte character cut off by the probe end.
+        codecs.getincrementaldecoder("utf-8")().decode(probe, final=False)
+    except UnicodeDecodeError:
         return False
     return True
 
 
-def main():
+def decode_text(data):
     """
-    Recursively copy the contents of all readable text files in the specified folder to clipboard.
+    Decode the raw content of a text file.
+
+    Content starting with a UTF-16 BOM is decoded as UTF-16, everything else as
+    UTF-8. Undecodable bytes are replaced. Like reading in text mode, CRLF and CR
+    line endings are translated to LF.
+
+    Args:
+        data (bytes): The raw file content.
+
+    Returns:
+        str: The decoded text.
+    """
+    if data.startswith(UTF16_BOMS):
+        text = data.decode("utf-16", "replace")
+    else:
+        text = data.decode("utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def iter_files(directory):
+    """
+    Yield the paths of all candidate text files in a directory tree.
+
+    Hidden directories (starting with ".") are skipped, as are files with a known
+    binary extension or larger than MAX_FILE_SIZE. The files of a directory are
+    yielded before descending into its subdirectories.
+
+    Args:
+        directory (str): The directory to walk.
+
+    Yields:
+        str: The path of each regular file.
+    """
+    # Explicit stack instead of recursion; subdirectories are pushed in reverse
+    # so they are still visited in directory order.
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        # Join the separator once; child paths are built by plain concatenation.
+        prefix = os.path.join(current, "")
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith("."):
+                            subdirs.append(prefix + name)
+                        continue
+                    # Cheap name check first; stat only the remaining candidates.
+                    if os.path.splitext(name)[1].lower() in BINARY_EXTENSIONS:
+                        continue
+                    # Symlinked files are included; symlinked directories are not followed.
+                    if not entry.is_file():
+                        continue
+                    if entry.stat().st_size > MAX_FILE_SIZE:
+                        continue
+                    yield prefix + name
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def write_text_files(stream, base_dir):
+    """
+    Write the separator, relative path and content of every text file to a stream.
+
+    The text is encoded as UTF-16-LE (without BOM) file by file, so only a single
+    file's content is held in memory at a time.
 
     For each file:
     - A separator and the relative path are added.
     - The file content is appended.
     - If the file's content ends with a newline, one extra empty line is added;
       otherwise, two empty lines are appended.
+
+    Args:
+        stream: Binary stream to write the encoded text to.
+        base_dir (str): The folder whose files are written.
+
+    Returns:
+        int: The number of files written.
+    """
+    count = 0
+    for file_path in iter_files(base_dir):
+        # Read each file once; the text check and decoding work on the buffer.
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except Exception:
+            continue
+        # Process file if it is empty or a text file.
+        if not is_text_data(data):
+            continue
+        content = decode_text(data)
+        rel_path = os.path.relpath(file_path, base_dir)
+        # Files are separated by a newline; the first one starts the output.
+        header = "\n" if count else ""
+        header += f"----------------\n{rel_path}:\n"
+        stream.write(header.encode(CLIP_ENCODING))
+        stream.write(content.encode(CLIP_ENCODING))
+        # Append extra newlines based on file content.
+        stream.write(NEWLINE if content.endswith("\n") else TWO_NEWLINES)
+        count += 1
+    return count
+
+
+def main():
+    """
+    Recursively copy the contents of all readable text files in the specified folder to clipboard.
+
+    The output is streamed to the clipboard file by file, see write_text_files.
     """
     print("Start to copy all files")
 
@@ -58,46 +200,13 @@ def main():
         print(f"Error: Directory '{base_dir}' not found.")
         sys.exit(1)
 
-    output_parts = []
-
-    for root, dirs, files in os.walk(base_dir):
-        # Exclude hidden directories (starting with ".")
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-        for file_name in files:
-            file_path = os.path.join(root, file_name)
-            if os.access(file_path, os.R_OK):
-                # Process file if it is empty or a text file.
-                if os.path.getsize(file_path) == 0 or is_text_file(file_path):
-                    rel_path = os.path.relpath(file_path, base_dir)
-                    output_parts.append("----------------")
-                    output_parts.append(f"{rel_path}:")
-                    try:
-                        with open(file_path, "r", errors="replace") as f:
-                            content = f.read()
-                    except Exception:
-                        continue
-                    output_parts.append(content)
-                    # Append extra newlines based on file content.
-                    if len(content) == 0:
-                        output_parts.append("")
-                        output_parts.append("")
-                    else:
-                        if content.endswith("\n"):
-                            output_parts.append("")
-                        else:
-                            output_parts.append("")
-                            output_parts.append("")
-
-    final_output = "\n".join(output_parts)
-    if not final_output.endswith("\n"):
-        final_output += "\n"
-
     try:
         # On Windows, use the built-in "clip" command.
-        # Windows clip expects Unicode text as UTF-16.
+        # Windows clip expects Unicode text as UTF-16, starting with a BOM.
         proc = subprocess.Popen("clip", stdin=subprocess.PIPE, shell=True)
-        proc.stdin.write(final_output.encode("utf-16"))
+        proc.stdin.write(codecs.BOM_UTF16_LE)
+        if write_text_files(proc.stdin, base_dir) == 0:
+            proc.stdin.write(NEWLINE)
         proc.stdin.close()
         proc.wait()
     except Exception as e:
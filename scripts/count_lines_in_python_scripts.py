@@ -8,23 +8,62 @@ Usage:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+
+READ_CHUNK_SIZE = 1 << 20
+# File reads are I/O-bound, so oversubscribe the cores to keep requests in flight.
+MAX_WORKERS = (os.cpu_count() or 1) * 4
 
 
 def count_lines_in_file(file_path: str) -> int:
-    """Return the number of lines in a single Python file."""
-    with open(file_path, "r", encoding="utf-8", errors="ignore") as file:
-        return sum(1 for _ in file)
+    """
+    Return the number of lines in a single Python file.
+
+    Like iterating the file in text mode, LF, CRLF and a bare CR all end a line.
+    """
+    lines = 0
+    last_chunk = b""
+    with open(file_path, "rb") as file:
+        # Count line endings on raw bytes; bytes.count runs in C without decoding.
+        while chunk := file.read(READ_CHUNK_SIZE):
+            lines += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            # A CRLF split across two chunks was counted twice.
+            if last_chunk.endswith(b"\r") and chunk.startswith(b"\n"):
+                lines -= 1
+            last_chunk = chunk
+    # A final line without a trailing line ending still counts as a line.
+    if last_chunk and not last_chunk.endswith((b"\n", b"\r")):
+        lines += 1
+    return lines
+
+
+def iter_python_files(directory: str) -> Iterator[str]:
+    """Yield the paths of all Python files in the given directory recursively."""
+    # Join the separator once; child paths are built by plain concatenation.
+    prefix = os.path.join(directory, "")
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(prefix + name)
+                # Cheap suffix test first; is_file only runs for Python files.
+                # Symlinked files are counted; symlinked directories are not followed.
+                elif name.endswith(".py") and entry.is_file():
+                    yield prefix + name
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from iter_python_files(subdir)
 
 
 def count_lines_in_directory(directory: str) -> int:
     """Count total lines in all Python files in the given directory recursively."""
-    total_lines = 0
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.endswith(".py"):
-                file_path = os.path.join(root, filename)
-                total_lines += count_lines_in_file(file_path)
-    return total_lines
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return sum(executor.map(count_lines_in_file, iter_python_files(directory)))
 
 
 def main() -> None:
@@ -7,11 +7,17 @@ Crop an image by a certain amount of pixels at every side.
 The cropped image will be saved beside the input image with
 the name <input_image>_cropped.<file_extension>
 
+JPEG images are cropped losslessly with jpegtran (if installed) to skip the
+decode/re-encode round trip. Other formats, or crops jpegtran cannot do
+exactly, go through PIL.
+
 Usage: python3 crop_image.py path/to/your/image.jpg
 """
 
 import argparse
 import os
+import shutil
+import subprocess
 
 from PIL import Image
 
@@ -20,27 +26,61 @@ crop_right = 0
 crop_bottom = 0
 crop_top = 0
 
+JPEG_EXTENSIONS = (".jpg", ".jpeg")
+# jpegtran can only cut exactly at the top/left on (i)MCU boundaries; 16 covers all chroma subsamplings.
+JPEG_MCU_SIZE = 16
+
+def crop_box(width, height):
+    """Return the (left, top, right, bottom) crop box for an image of the given size."""
+    return crop_left, crop_top, width - crop_right, height - crop_bottom
+
 def crop_image(input_path):
     """Crop the image by the specified pixel values at the respective sides."""
     image = Image.open(input_path)
-    width, height = image.size
-    left = crop_left
-    top = crop_top
-    right = width - crop_right
-    bottom = height - crop_bottom
-    cropped = image.crop((left, top, right, bottom))
+    cropped = image.crop(crop_box(*image.size))
     return cropped
 
-def save_cropped_image(image, input_path):
+def cropped_output_path(input_path):
     """
-    Save the cropped image beside the input image.
-    
+    Return the path of the cropped image beside the input image.
+
     The names are specified by: <input_image>_cropped.<file_extension>.
     """
     directory, filename = os.path.split(input_path)
     name, ext = os.path.splitext(filename)
     output_filename = f"{name}_cropped{ext}"
-    output_path = os.path.join(directory, output_filename)
+    return os.path.join(directory, output_filename)
+
+def crop_jpeg_lossless(input_path, output_path):
+    """
+    Crop a JPEG without re-encoding it by running jpegtran.
+
+    Returns True on success. False is returned if jpegtran is not installed or
+    cannot crop exactly at the requested offsets (not on an MCU boundary).
+    """
+    if shutil.which("jpegtran") is None:
+        return False
+    with Image.open(input_path) as image:
+        left, top, right, bottom = crop_box(*image.size)
+    if left % JPEG_MCU_SIZE or top % JPEG_MCU_SIZE:
+        return False
+    result = subprocess.run(
+        [
+            "jpegtran", "-copy", "all",
+            "-crop", f"{right - left}x{bottom - top}+{left}+{top}",
+            "-outfile", output_path, input_path,
+        ],
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+def save_cropped_image(image, input_path):
+    """
+    Save the cropped image beside the input image.
+    
+    The names are specified by: <input_image>_cropped.<file_extension>.
+    """
+    output_path = cropped_output_path(input_path)
     image.save(output_path)
     print(f"Saved cropped image to {output_path}")
 
@@ -58,6 +98,11 @@ def parse_arguments():
 def main():
     """Execute the cropping operation."""
     args = parse_arguments()
+    if args.input_image.lower().endswith(JPEG_EXTENSIONS):
+        output_path = cropped_output_path(args.input_image)
+        if crop_jpeg_lossless(args.input_image, output_path):
+            print(f"Saved cropped image to {output_path}")
+            return
     cropped_image = crop_image(args.input_image)
     save_cropped_image(cropped_image, args.input_image)
 
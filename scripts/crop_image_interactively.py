@@ -30,6 +30,11 @@ import numpy as np
 MAX_PREVIEW_WIDTH = 1800
 MAX_PREVIEW_HEIGHT = 900
 HANDLE_RADIUS = 8
+HANDLE_GRAB_RADIUS_SQ = (HANDLE_RADIUS * 2) ** 2
+# Extent of a drawn handle around its center, including the active ring
+HANDLE_EXTENT = HANDLE_RADIUS + 4
+# Extent of the 2 px rectangle outline around its edges
+RECT_EXTENT = 2
 
 
 # Globals shared with callbacks
@@ -39,13 +44,19 @@ preview_scale: float = 1.0
 points_preview: List[Tuple[int, int]] = []
 active_idx: Optional[int] = None
 dragging: bool = False
+overlay_dirty: bool = True
+
+# Persistent canvas and the regions (x0, y0, x1, y1) covered by the last overlay
+overlay_canvas: Optional[np.ndarray] = None
+overlay_regions: List[Tuple[int, int, int, int]] = []
 
 
 def compute_preview(image: np.ndarray) -> Tuple[np.ndarray, float]:
     """
     Compute a preview image scaled to fit within MAX_PREVIEW_WIDTH x MAX_PREVIEW_HEIGHT.
 
-    The aspect ratio is preserved. Images smaller than the maximum box are not upscaled.
+    The aspect ratio is preserved. Images smaller than the maximum box are not upscaled;
+    for those the input array itself is returned.
 
     Args:
         image: Input image in BGR format.
@@ -62,7 +73,8 @@ def compute_preview(image: np.ndarray) -> Tuple[np.ndarray, float]:
         new_h = int(round(h * scale))
         preview = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_AREA)
     else:
-        preview = image.copy()
+        # The preview is never drawn on directly, so the original can be shared
+        preview = image
     return preview, scale
 
 
@@ -84,25 +96,59 @@ def preview_to_orig(pt: Tuple[int, int], scale: float) -> Tuple[int, int]:
     return x, y
 
 
+def bounding_region(x0: int, y0: int, x1: int, y1: int, margin: int) -> Tuple[int, int, int, int]:
+    """
+    Compute the region covering [x0, x1] x [y0, y1] grown by margin on every side.
+
+    Args:
+        x0, y0: Top-left corner (inclusive).
+        x1, y1: Bottom-right corner (inclusive).
+        margin: Number of pixels to grow the region by.
+
+    Returns:
+        Region (x0, y0, x1, y1) usable for slicing, with exclusive end and non-negative start.
+    """
+    return max(x0 - margin, 0), max(y0 - margin, 0), x1 + margin + 1, y1 + margin + 1
+
+
 def draw_overlay() -> None:
     """
     Redraw the preview window with current selection overlay.
     Handles and rectangle are always visible if defined.
+
+    The canvas is kept between calls. Only the regions covered by the previous
+    overlay are restored from the preview before drawing the new overlay.
     """
+    global overlay_canvas, overlay_regions
+
     assert preview_image is not None
-    canvas = preview_image.copy()
+    if overlay_canvas is None:
+        overlay_canvas = preview_image.copy()
+    else:
+        for x0, y0, x1, y1 in overlay_regions:
+            overlay_canvas[y0:y1, x0:x1] = preview_image[y0:y1, x0:x1]
+    canvas = overlay_canvas
+    regions = []
 
     if len(points_preview) > 0:
         for idx, (x, y) in enumerate(points_preview):
             cv2.circle(canvas, (x, y), HANDLE_RADIUS, (0, 255, 0), -1)
             if idx == active_idx:
                 cv2.circle(canvas, (x, y), HANDLE_RADIUS + 3, (0, 200, 255), 1)
+            regions.append(bounding_region(x, y, x, y, HANDLE_EXTENT))
 
     if len(points_preview) == 2:
         p1 = points_preview[0]
         p2 = points_preview[1]
         cv2.rectangle(canvas, p1, p2, (0, 255, 0), 2)
-
+        x_min, x_max = sorted([p1[0], p2[0]])
+        y_min, y_max = sorted([p1[1], p2[1]])
+        regions.append(bounding_region(x_min, y_min, x_max, y_min, RECT_EXTENT))
+        regions.append(bounding_region(x_min, y_max, x_max, y_max, RECT_EXTENT))
+        regions.append(bounding_region(x_min, y_min, x_min, y_max, RECT_EXTENT))
+        regions.append(bounding_region(x_max, y_min, x_max, y_max, RECT_EXTENT))
+
+    overlay_regions = regions
     cv2.imshow("Image", canvas)
 
 
@@ -118,7 +164,9 @@ def find_near_handle(x: int, y: int) -> Optional[int]:
         Index of the nearby handle if found, else None.
     """
     for idx, (hx, hy) in enumerate(points_preview):
-        if (x - hx) ** 2 + (y - hy) ** 2 <= (HANDLE_RADIUS * 2) ** 2:
+        dx = x - hx
+        dy = y - hy
+        if dx * dx + dy * dy <= HANDLE_GRAB_RADIUS_SQ:
             return idx
     return None
 
@@ -150,7 +198,7 @@ def click_and_crop(event: int, x: int, y: int, flags: int, param: object) -> Non
     - If two points exist, left-click near a handle to grab it, then drag to move.
     - Releasing the button drops the handle.
     """
-    global points_preview, active_idx, dragging
+    global points_preview, active_idx, dragging, overlay_dirty
 
     if event == cv2.EVENT_LBUTTONDOWN:
         if len(points_preview) < 2:
@@ -158,18 +206,23 @@ def click_and_crop(event: int, x: int, y: int, flags: int, param: object) -> Non
             points_preview.append((x, y))
             active_idx = len(points_preview) - 1
             dragging = True
+            overlay_dirty = True
         else:
             idx = find_near_handle(x, y)
             if idx is not None:
                 active_idx = idx
                 dragging = True
+                overlay_dirty = True
 
     elif event == cv2.EVENT_MOUSEMOVE:
         if dragging and active_idx is not None:
             x, y = clamp_point_to_image(x, y, preview_image)
             points_preview[active_idx] = (x, y)
+            overlay_dirty = True
 
     elif event == cv2.EVENT_LBUTTONUP:
+        if active_idx is not None:
+            overlay_dirty = True
         dragging = False
         active_idx = None
 
@@ -198,11 +251,10 @@ def save_cropped(image_path: str) -> bool:
     x_min, x_max = sorted([x1, x2])
     y_min, y_max = sorted([y1, y2])
 
+    # Clamp all four bounds in a single vectorized call
     h, w = orig_image.shape[:2]
-    x_min = max(0, min(x_min, w - 1))
-    x_max = max(0, min(x_max, w))
-    y_min = max(0, min(y_min, h - 1))
-    y_max = max(0, min(y_max, h))
+    bounds = np.clip((x_min, x_max, y_min, y_max), 0, (w - 1, w, h - 1, h))
+    x_min, x_max, y_min, y_max = (int(v) for v in bounds)
 
     if x_max <= x_min or y_max <= y_min:
         print("[ERROR] Invalid crop region. No image saved.")
@@ -260,7 +312,7 @@ def main() -> None:
     """
     Entry point that loads the image, shows a scalable preview, and handles user input.
     """
-    global orig_image, preview_image, preview_scale, points_preview
+    global orig_image, preview_image, preview_scale, points_preview, overlay_dirty
 
     if len(sys.argv) < 2:
         print("Usage: python crop_image.py <image_path>")
@@ -289,8 +341,10 @@ def main() -> None:
     print("[INFO] Press 'c' or Enter to crop and save. Press 'q' or ESC to quit.")
 
     while True:
-        # Persistent overlay rendering (handles visible even when not clicking)
-        draw_overlay()
+        # Redraw only when the selection changed; the window keeps showing the last canvas
+        if overlay_dirty:
+            draw_overlay()
+            overlay_dirty = False
 
         key = cv2.waitKey(10) & 0xFF
 
@@ -301,6 +355,7 @@ def main() -> None:
 
         if key == ord("r"):
             points_preview = []
+            overlay_dirty = True
             print("[INFO] Selection reset. Click two new points.")
 
         if key in (ord("c"), 13, 10):  # 'c' or Enter
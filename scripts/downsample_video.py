@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 """Downsamples the 4k video into a full hd video. The resulting video will be saved next to the input video as <input_video>_output.<input_video_extension>
 
+If FFmpeg is installed, the whole decode/scale/encode pipeline runs inside FFmpeg.
+Otherwise (or with "--engine opencv") the frames are resized with OpenCV, on the GPU
+if OpenCV was built with CUDA support and a CUDA device is present.
+
 Usage:
-    python downsample_video.py <video_path>
+    python downsample_video.py <video_path> [--engine {auto,ffmpeg,opencv}]
 """
 
 import cv2
 import os
 import argparse
+import shutil
+import subprocess
+from queue import Queue
+from threading import Event, Thread
+from typing import List
+
+TARGET_WIDTH = 1920
+TARGET_HEIGHT = 1080
+# Frames buffered between the decode, resize and encode stages
+PIPELINE_QUEUE_SIZE = 8
 
 def parse_args():
     """
@@ -20,25 +34,139 @@ def parse_args():
         "video_path",
         help="Path to the MP4 video file"
     )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "ffmpeg", "opencv"],
+        default="auto",
+        help="Processing engine. 'auto' uses FFmpeg if installed, else OpenCV (default: auto)."
+    )
     return parser.parse_args()
 
-def downscale_video(input_path: str) -> None:
+def downscale_video_ffmpeg(input_path: str, output_video: str) -> None:
     """
-    Downscale a 4K video to Full HD (1920x1080) using OpenCV.
+    Downscale a video to Full HD (1920x1080) by running FFmpeg.
+
+    Decoding, scaling and encoding all happen in native code; the audio stream is copied.
 
     Parameters
     ----------
     input_path : str
         Path to the input video file.
-    output_path : str
+    output_video : str
         Path where the output Full HD video will be saved.
     """
-    folder, filename = os.path.split(input_path)
-    name, ext = os.path.splitext(filename)
-    output_video = os.path.join(folder, f"{name}_output{ext}")
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-i", input_path,
+            "-vf", f"scale={TARGET_WIDTH}:{TARGET_HEIGHT}:flags=area",
+            "-c:v", "libx264",
+            "-c:a", "copy",
+            output_video,
+        ],
+        check=True,
+    )
+
+def cuda_available() -> bool:
+    """
+    Check whether OpenCV was built with CUDA and a CUDA device is present.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+def open_capture(input_path: str) -> cv2.VideoCapture:
+    """
+    Open a video for reading, requesting hardware decoding if OpenCV supports it.
+
+    The FFmpeg backend falls back to software decoding if no accelerator is available.
+    Builds without the FFmpeg backend use OpenCV's automatic backend selection.
+    """
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        cap = cv2.VideoCapture(
+            input_path,
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(input_path)
+
+def open_writer(output_video: str, fourcc: int, fps: float) -> cv2.VideoWriter:
+    """
+    Open a Full HD video writer, requesting hardware encoding if OpenCV supports it.
+
+    Builds without the FFmpeg backend use OpenCV's automatic backend selection.
+    """
+    size = (TARGET_WIDTH, TARGET_HEIGHT)
+    if hasattr(cv2, "VIDEOWRITER_PROP_HW_ACCELERATION"):
+        out = cv2.VideoWriter(
+            output_video,
+            cv2.CAP_FFMPEG,
+            fourcc,
+            fps,
+            size,
+            [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+        )
+        if out.isOpened():
+            return out
+        out.release()
+    return cv2.VideoWriter(output_video, fourcc, fps, size)
+
+def read_frames(cap: cv2.VideoCapture, frames: Queue, stop: Event, errors: List[BaseException]) -> None:
+    """
+    Decode all frames of a capture into a queue, followed by None as end marker.
+
+    Decoding ends early once stop is set. Errors are collected in errors; the end
+    marker is always sent, so the consumer never waits forever.
+    """
+    try:
+        while not stop.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.put(frame)
+    except Exception as e:  # re-raised by downscale_video_opencv after join
+        errors.append(e)
+    finally:
+        frames.put(None)
+
+def write_frames(out: cv2.VideoWriter, frames: Queue, errors: List[BaseException]) -> None:
+    """
+    Encode frames from a queue until the None end marker is received.
 
+    After an error (collected in errors) the remaining frames are only drained, so
+    the producer never blocks on a full queue.
+    """
+    failed = False
+    while (frame := frames.get()) is not None:
+        if failed:
+            continue
+        try:
+            out.write(frame)
+        except Exception as e:  # re-raised by downscale_video_opencv after join
+            errors.append(e)
+            failed = True
+
+def downscale_video_opencv(input_path: str, output_video: str) -> None:
+    """
+    Downscale a video to Full HD (1920x1080) using OpenCV.
+
+    The resize runs on the GPU via cv2.cuda when available, otherwise on the CPU.
+    Decoding and encoding run in separate threads connected by bounded queues, so
+    the three stages overlap.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the input video file.
+    output_video : str
+        Path where the output Full HD video will be saved.
+    """
     # Open input video
-    cap = cv2.VideoCapture(input_path)
+    cap = open_capture(input_path)
     if not cap.isOpened():
         raise IOError(f"Cannot open video file {input_path}")
 
@@ -47,21 +175,82 @@ def downscale_video(input_path: str) -> None:
     fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # Codec for mp4
 
     # Set output writer with Full HD resolution
-    out = cv2.VideoWriter(output_video, fourcc, fps, (1920, 1080))
+    out = open_writer(output_video, fourcc, fps)
+
+    # GPU buffers are allocated once and reused for every frame
+    use_cuda = cuda_available()
+    if use_cuda:
+        gpu_frame = cv2.cuda_GpuMat()
+        gpu_resized = cv2.cuda_GpuMat(TARGET_HEIGHT, TARGET_WIDTH, cv2.CV_8UC3)
+
+    # Decode and encode run in their own threads, overlapping with the resize
+    decoded = Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    resized = Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = Event()
+    errors: List[BaseException] = []
+    reader = Thread(target=read_frames, args=(cap, decoded, stop, errors), daemon=True)
+    writer = Thread(target=write_frames, args=(out, resized, errors), daemon=True)
+    reader.start()
+    writer.start()
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    reader_done = False
+    try:
+        # Stop early if the reader or writer thread failed
+        while not errors:
+            frame = decoded.get()
+            if frame is None:
+                reader_done = True
+                break
 
-        # Resize frame to Full HD
-        resized_frame = cv2.resize(frame, (1920, 1080), interpolation=cv2.INTER_AREA)
+            # Resize frame to Full HD
+            if use_cuda:
+                gpu_frame.upload(frame)
+                cv2.cuda.resize(
+                    gpu_frame, (TARGET_WIDTH, TARGET_HEIGHT), dst=gpu_resized, interpolation=cv2.INTER_AREA
+                )
+                resized_frame = gpu_resized.download()
+            else:
+                resized_frame = cv2.resize(frame, (TARGET_WIDTH, TARGET_HEIGHT), interpolation=cv2.INTER_AREA)
+
+            # Hand over to the writer thread
+            resized.put(resized_frame)
+    finally:
+        stop.set()
+        resized.put(None)
+        # Unblock a reader waiting on the full queue until it sends its end marker
+        if not reader_done:
+            while decoded.get() is not None:
+                pass
+        reader.join()
+        writer.join()
+        cap.release()
+        out.release()
+
+    if errors:
+        raise errors[0]
+
+def downscale_video(input_path: str, engine: str = "auto") -> None:
+    """
+    Downscale a 4K video to Full HD (1920x1080).
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the input video file.
+    engine : str
+        "ffmpeg", "opencv" or "auto" (FFmpeg if it is installed, else OpenCV).
+    """
+    folder, filename = os.path.split(input_path)
+    name, ext = os.path.splitext(filename)
+    output_video = os.path.join(folder, f"{name}_output{ext}")
 
-        # Write to output video
-        out.write(resized_frame)
+    if engine == "auto":
+        engine = "ffmpeg" if shutil.which("ffmpeg") else "opencv"
 
-    cap.release()
-    out.release()
+    if engine == "ffmpeg":
+        downscale_video_ffmpeg(input_path, output_video)
+    else:
+        downscale_video_opencv(input_path, output_video)
     print(f"Video successfully downscaled to {output_video}")
 
 
@@ -69,5 +258,5 @@ if __name__ == "__main__":
     args = parse_args()
 
     print(f"Starting conversion of video {args.video_path}")
-    downscale_video(args.video_path)
+    downscale_video(args.video_path, args.engine)
     print(f"Video conversion completed")
@@ -11,6 +11,10 @@ Overview:
       If no size is given, frames are unified to the first frame's size.
     - Frame duration is specified in milliseconds ("--duration-ms").
     - Output is written as a single animated GIF.
+    - "--raw frames.npy" reads the frames from an array written by
+      "mp4_to_saved_images.py --ext raw" instead of from image files.
+    - Frame resizing is several times faster with the source-compatible
+      Pillow-SIMD fork (pip uninstall pillow && CC="cc -mavx2" pip install pillow-simd).
 
 Examples:
     # Pick files via GUI, 1 fps (1000 ms/frame), infinite loop
@@ -18,25 +22,61 @@ Examples:
 
     # Use explicit files, resize to 800x450, keep aspect ratio with padding
     python make_gif.py --duration-ms 80 --size 800x450 --keep-aspect
+
+    # Frames extracted with "mp4_to_saved_images.py video.mp4 frames --ext raw"
+    python make_gif.py --raw frames/frames.npy --duration-ms 40
 """
 
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
 
-from PIL import Image, ImageOps, features
+from PIL import Image, features
 
-# Pick a quantization method supported by the current Pillow build.
-# Prefer libimagequant (best quality) if compiled in; else use FASTOCTREE; else MEDIANCUT.
-if features.check("libimagequant"):
-    QUANTIZE_METHOD = Image.LIBIMAGEQUANT  # requires libimagequant at compile time
-else:
-    # FASTOCTREE is builtin and generally available on Pillow wheels.
-    QUANTIZE_METHOD = getattr(Image, "FASTOCTREE", 0)  # 0 == MEDIANCUT fallback
+# Pick a quantization method supported by the current Pillow build, resolved once at import.
+# Prefer libimagequant (best quality) if compiled in; else the builtin FASTOCTREE.
+QUANTIZE_METHOD = (
+    Image.Quantize.LIBIMAGEQUANT if features.check("libimagequant") else Image.Quantize.FASTOCTREE
+)
 
-from contextlib import contextmanager
+# Large downscales first shrink by an integer factor with a cheap box filter, so Lanczos
+# only runs on an image at most this many times the target size (visually identical).
+RESIZE_REDUCING_GAP = 3.0
+
+# Image file suffixes picked up when a directory is given
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp", ".gif"})
+
+
+class RawFrame(NamedTuple):
+    """
+    One frame of a frames.npy array (N x H x W x 3, BGR) from mp4_to_saved_images.py.
+    """
+
+    path: Path
+    index: int
+
+
+@lru_cache(maxsize=1)
+def load_raw_frames(path: Path):
+    """
+    Memory-map a frames.npy array, once per process.
+
+    Args:
+        path: Path to the .npy file.
+
+    Returns:
+        Read-only numpy memmap of shape (N, H, W, 3) in BGR order.
+    """
+    import numpy as np
+
+    return np.load(path, mmap_mode="r")
 
 
 def parse_size(text: Optional[str]) -> Optional[Tuple[int, int]]:
@@ -110,32 +150,50 @@ def discover_images(paths: Sequence[str]) -> List[Path]:
         if not candidate.exists():
             raise FileNotFoundError(f"Path does not exist: {candidate}")
         if candidate.is_dir():
-            # Include common image extensions
-            resolved.extend(
-                sorted(
-                    list(candidate.glob("*.png"))
-                    + list(candidate.glob("*.jpg"))
-                    + list(candidate.glob("*.jpeg"))
-                    + list(candidate.glob("*.bmp"))
-                    + list(candidate.glob("*.tif"))
-                    + list(candidate.glob("*.tiff"))
-                    + list(candidate.glob("*.webp"))
-                    + list(candidate.glob("*.gif"))
-                )
-            )
+            # Include common image extensions, found in a single directory scan
+            with os.scandir(candidate) as entries:
+                found = [
+                    Path(e.path)
+                    for e in entries
+                    if os.path.splitext(e.name)[1].lower() in IMAGE_SUFFIXES and e.is_file()
+                ]
+            resolved.extend(sorted(found))
         else:
             resolved.append(candidate)
     # De-duplicate while preserving order
     seen = set()
     unique = []
     for p in resolved:
-        if p not in seen:
-            seen.add(p)
+        key = str(p)
+        if key not in seen:
+            seen.add(key)
             unique.append(p)
     if not unique:
         raise ValueError("No input images found.")
     return unique
 
+def fit_size(src_size: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Compute the largest size with the aspect ratio of src_size that fits into box.
+
+    Matches the size chosen by ImageOps.contain.
+
+    Args:
+        src_size: Source (width, height).
+        box: Target (width, height) to fit into.
+
+    Returns:
+        Fitted (width, height).
+    """
+    src_w, src_h = src_size
+    im_ratio = src_w / src_h
+    dest_ratio = box[0] / box[1]
+    if im_ratio > dest_ratio:
+        return box[0], round(src_h / src_w * box[0])
+    if im_ratio < dest_ratio:
+        return round(src_w / src_h * box[1]), box[1]
+    return box
+
 def flatten_alpha_to_bg(img: Image.Image, bg_rgb: Tuple[int, int, int]) -> Image.Image:
     """
     Remove alpha by compositing the image over a solid background color.
@@ -147,67 +205,93 @@ def flatten_alpha_to_bg(img: Image.Image, bg_rgb: Tuple[int, int, int]) -> Image
     Returns:
         RGB image without alpha.
     """
-    if img.mode in ("RGBA", "LA") or ("transparency" in img.info):
+    # Any alpha band counts, including PA and premultiplied RGBa/La
+    if {"A", "a"} & set(img.getbands()) or "transparency" in img.info:
+        # Pillow converts premultiplied La only to LA, not directly to RGBA
+        src = img.convert("LA") if img.mode == "La" else img
+        rgba = src if src.mode == "RGBA" else src.convert("RGBA")
+        # Blend straight onto the RGB background using alpha as paste mask
         rgb = Image.new("RGB", img.size, bg_rgb)
-        return Image.alpha_composite(rgb.convert("RGBA"), img.convert("RGBA")).convert("RGB")
+        rgb.paste(rgba, mask=rgba.getchannel("A"))
+        return rgb
     return img.convert("RGB")
 
 def prepare_frame(
-    path: Path,
+    path: Union[Path, RawFrame],
     size: Optional[Tuple[int, int]],
     keep_aspect: bool,
     background: Tuple[int, int, int],
+    palette: Optional[Image.Image] = None,
 ) -> Image.Image:
     """
-    Load an image, optionally resize, remove alpha, and quantize for GIF.
+    Load an image, remove alpha, optionally resize, and quantize for GIF.
 
     Args:
-        path: Image file path.
+        path: Image file path, or a frame of a frames.npy array.
         size: Target (width, height) or None to keep original size.
         keep_aspect: If True, fit within size and pad; otherwise stretch to size.
         background: Background color used when removing alpha and padding.
+        palette: Optional palette-mode image whose palette is reused. The frame is
+            then only remapped to it, skipping the palette construction.
 
     Returns:
         Palette-mode image suitable for GIF.
     """
-    with Image.open(path) as im:
-        im = im.convert("RGBA")
-        if size is not None:
-            if keep_aspect:
-                # Fit inside the target while preserving aspect, then pad
-                fitted = ImageOps.contain(im, size, Image.Resampling.LANCZOS)
-                canvas = Image.new("RGBA", size, background + (255,))
-                x = (size[0] - fitted.width) // 2
-                y = (size[1] - fitted.height) // 2
-                canvas.paste(fitted, (x, y))
-                im = canvas
-            else:
-                im = im.resize(size, Image.Resampling.LANCZOS)
-        # Remove alpha and quantize to 256 colors for GIF
-        im_rgb = flatten_alpha_to_bg(im, background)
-        im_p = im_rgb.quantize(colors=256, method=QUANTIZE_METHOD)
-        return im_p
+    if isinstance(path, RawFrame):
+        # Raw frames have no alpha; only reorder BGR to RGB, no decoding
+        im_rgb = Image.fromarray(load_raw_frames(path.path)[path.index][..., ::-1])
+    else:
+        with Image.open(path) as im:
+            # Remove alpha at source resolution, so only the three color channels are resized
+            im_rgb = flatten_alpha_to_bg(im, background)
+    if size is not None:
+        if keep_aspect:
+            # Fit inside the target while preserving aspect, then pad
+            fitted = im_rgb.resize(
+                fit_size(im_rgb.size, size), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP
+            )
+            canvas = Image.new("RGB", size, background)
+            x = (size[0] - fitted.width) // 2
+            y = (size[1] - fitted.height) // 2
+            canvas.paste(fitted, (x, y))
+            im_rgb = canvas
+        else:
+            im_rgb = im_rgb.resize(size, Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+    # Quantize to 256 colors for GIF
+    if palette is not None:
+        return im_rgb.quantize(palette=palette)
+    im_p = im_rgb.quantize(colors=256, method=QUANTIZE_METHOD)
+    return im_p
 
 def create_gif(
-    image_paths: Iterable[Path],
+    image_paths: Iterable[Union[Path, RawFrame]],
     output_path: Path,
     duration_ms: int,
     size: Optional[Tuple[int, int]],
     keep_aspect: bool,
     loop: int,
     background: Tuple[int, int, int],
+    jobs: int = 0,
+    shared_palette: bool = False,
 ) -> None:
     """
     Build an animated GIF from a sequence of images.
 
+    Frames are prepared in parallel worker processes, since decoding, resizing and
+    quantizing are independent per frame.
+
     Args:
-        image_paths: Iterable of image file paths in desired order.
+        image_paths: Iterable of image file paths (or raw frames) in desired order.
         output_path: Output GIF file path.
         duration_ms: Frame duration in milliseconds.
         size: Optional (width, height) to resize frames. If None, first image size is used.
         keep_aspect: Preserve aspect ratio with padding when resizing.
         loop: Number of loops; 0 means infinite.
         background: RGB tuple used for alpha removal and padding.
+        jobs: Number of worker processes; 0 means one per CPU core, 1 disables parallelism.
+        shared_palette: Quantize only the first frame and remap all other frames to its
+            palette. Faster and gives a smaller file, but frames whose colors differ from
+            the first one lose quality.
 
     Raises:
         ValueError: If fewer than two frames are provided.
@@ -216,7 +300,30 @@ def create_gif(
     if len(paths) < 2:
         raise ValueError("At least two images are required to create a GIF.")
 
-    frames = [prepare_frame(p, size, keep_aspect, background) for p in paths]
+    first_frame = None
+    palette = None
+    if shared_palette:
+        # The first frame defines the palette for the whole animation. Only a 1x1 image
+        # carrying that palette is handed to the workers, not the whole frame.
+        first_frame = prepare_frame(paths[0], size, keep_aspect, background)
+        palette = Image.new("P", (1, 1))
+        palette.putpalette(first_frame.getpalette())
+        todo = paths[1:]
+    else:
+        todo = paths
+
+    workers = min(jobs or os.cpu_count() or 1, len(todo))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            frames = list(
+                executor.map(
+                    prepare_frame, todo, repeat(size), repeat(keep_aspect), repeat(background), repeat(palette)
+                )
+            )
+    else:
+        frames = [prepare_frame(p, size, keep_aspect, background, palette) for p in todo]
+    if first_frame is not None:
+        frames.insert(0, first_frame)
 
     # If no size was specified, unify to the size of the first prepared frame
     if size is None:
@@ -248,6 +355,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         nargs="*",
         help="Image files or directories. If omitted, a GUI picker will open.",
     )
+    p.add_argument(
+        "--raw",
+        type=Path,
+        default=None,
+        help="Read the frames from a frames.npy array (mp4_to_saved_images.py --ext raw) instead of images.",
+    )
     p.add_argument(
         "--output",
         type=Path,
@@ -283,6 +396,17 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=0,
         help="Number of loops; 0 means infinite. Default: 0.",
     )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Number of worker processes preparing frames; 0 means one per CPU core. Default: 0.",
+    )
+    p.add_argument(
+        "--shared-palette",
+        action="store_true",
+        help="Reuse the first frame's palette for all frames (faster, smaller; best for similar frames).",
+    )
     return p
 
 def parse_bg_hex(hex_rgb: str) -> Tuple[int, int, int]:
@@ -308,11 +432,18 @@ def main() -> None:
     """
     Entry point for the CLI.
     """
-    args = build_arg_parser().parse_args()
+    parser = build_arg_parser()
+    args = parser.parse_args()
     size = parse_size(args.size)
     bg = parse_bg_hex(args.bg)
 
-    if args.images:
+    if args.raw is not None:
+        if args.images:
+            parser.error("--raw cannot be combined with image arguments")
+        if not args.raw.is_file():
+            raise FileNotFoundError(f"Path does not exist: {args.raw}")
+        paths = [RawFrame(args.raw, i) for i in range(len(load_raw_frames(args.raw)))]
+    elif args.images:
         paths = discover_images(args.images)
     else:
         with select_images_via_gui_ctx() as selected:
@@ -333,6 +464,8 @@ def main() -> None:
         keep_aspect=args.keep_aspect,
         loop=args.loop,
         background=bg,
+        jobs=args.jobs,
+        shared_palette=args.shared_palette,
     )
     print(f"GIF written to: {args.output.with_suffix('.gif')}")
 
@@ -6,19 +6,30 @@ Usage:
     python mp4_to_saved_images.py <video_path> <output_folder>
                                   [--step N]
                                   [--rotate DEG]
-                                  [--ext {jpg,png}]
+                                  [--ext {jpg,png,raw}]
                                   [--jpeg-quality Q]
                                   [--png-compression C]
                                   [--threads T]
+                                  [--engine {cv2,pyav}]
+                                  [--writer {python,ffmpeg}]
+
+--ext raw stores all frames uncompressed in a single <output_folder>/frames.npy
+array (N x H x W x 3, BGR), for frames that are only an intermediate step;
+make_gif.py reads it directly via --raw.
 """
 
 import argparse
 import os
+import shutil
+import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
-from typing import List
+from itertools import chain
+from queue import Queue
+from threading import Thread
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import cv2
+import numpy as np
 
 
 def parse_args() -> argparse.Namespace:
@@ -53,9 +64,12 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--ext",
-        choices=["jpg", "png"],
+        choices=["jpg", "png", "raw"],
         default="jpg",
-        help="Output image format (default: jpg).",
+        help=(
+            "Output image format (default: jpg). 'raw' writes one uncompressed frames.npy "
+            "array instead of image files (ignores --threads and --writer)."
+        ),
     )
     parser.add_argument(
         "--jpeg-quality",
@@ -67,7 +81,10 @@ def parse_args() -> argparse.Namespace:
         "--png-compression",
         type=int,
         default=1,
-        help="PNG compression 0..9 (default: 1). 0 = fastest, 9 = smallest files.",
+        help=(
+            "PNG compression 0..9 (default: 1). 0 = fastest, 9 = smallest files. "
+            "Levels 0 and 1 use fpng if it is installed."
+        ),
     )
     parser.add_argument(
         "--threads",
@@ -75,6 +92,21 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Number of worker threads for disk writes (0 = synchronous).",
     )
+    parser.add_argument(
+        "--engine",
+        choices=["cv2", "pyav"],
+        default="cv2",
+        help="Video decoding engine (default: cv2). 'pyav' requires the 'av' package.",
+    )
+    parser.add_argument(
+        "--writer",
+        choices=["python", "ffmpeg"],
+        default="python",
+        help=(
+            "How frames are encoded (default: python). 'python' writes each image from Python, "
+            "'ffmpeg' pipes raw frames into a single FFmpeg process (ignores --threads)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -95,6 +127,384 @@ def _imwrite_params(ext: str, jpeg_quality: int, png_compression: int) -> List[i
     return [cv2.IMWRITE_PNG_COMPRESSION, int(png_compression)]
 
 
+def _write_bytes(filename: str, data: bytes) -> None:
+    """
+    Write already encoded image data to a file.
+
+    Args:
+        filename (str): Output file path.
+        data (bytes): Encoded image.
+    """
+    with open(filename, "wb") as f:
+        f.write(data)
+
+
+def _make_frame_writer(ext: str, jpeg_quality: int, png_compression: int) -> Callable[[str, np.ndarray], None]:
+    """
+    Build the function that encodes and writes a single frame.
+
+    JPEGs are encoded with libjpeg-turbo through PyTurboJPEG if it is installed,
+    which uses its SIMD encoder regardless of how OpenCV was built. PNGs are
+    encoded with fpng if it is installed and a fast compression level (0 or 1)
+    was requested; fpng has no compression levels and is several times faster
+    than zlib at similar file sizes. Otherwise cv2.imwrite is used.
+
+    Args:
+        ext (str): "jpg" or "png".
+        jpeg_quality (int): JPEG quality 1..100.
+        png_compression (int): PNG compression 0..9.
+
+    Returns:
+        Callable[[str, np.ndarray], None]: Function taking the filename and BGR frame.
+    """
+    params = _imwrite_params(ext, jpeg_quality, png_compression)
+
+    def imwrite(filename: str, frame: np.ndarray) -> None:
+        cv2.imwrite(filename, frame, params)
+
+    if ext == "png":
+        if png_compression > 1:
+            return imwrite
+        try:
+            import fpng  # noqa: WPS433 (optional dependency)
+        except ImportError:
+            return imwrite
+
+        def fpng_write(filename: str, frame: np.ndarray) -> None:
+            # from_cv2 converts the BGR frame to the RGB order fpng expects
+            _write_bytes(filename, fpng.from_cv2(frame))
+
+        return fpng_write
+
+    try:
+        from turbojpeg import TJPF_BGR, TJSAMP_420, TurboJPEG  # noqa: WPS433 (optional dependency)
+        jpeg = TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return imwrite
+
+    def turbo_write(filename: str, frame: np.ndarray) -> None:
+        data = jpeg.encode(
+            frame, quality=int(jpeg_quality), pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420
+        )
+        _write_bytes(filename, data)
+
+    return turbo_write
+
+
+def _ffmpeg_quality_args(ext: str, jpeg_quality: int, png_compression: int) -> List[str]:
+    """
+    Translate the quality options into FFmpeg encoder arguments.
+
+    Args:
+        ext (str): "jpg" or "png".
+        jpeg_quality (int): JPEG quality 1..100, mapped linearly onto FFmpeg's qscale 31..2.
+        png_compression (int): PNG compression 0..9.
+
+    Returns:
+        List[str]: FFmpeg output arguments.
+    """
+    if ext == "jpg":
+        qscale = round(31 - (min(max(int(jpeg_quality), 1), 100) - 1) * 29 / 99)
+        return ["-q:v", str(qscale)]
+    return ["-compression_level", str(int(png_compression))]
+
+
+def _pipe_frames_to_ffmpeg(
+    frames: Iterator[np.ndarray],
+    rotation: Optional[int],
+    output_folder: str,
+    ext: str,
+    jpeg_quality: int,
+    png_compression: int,
+) -> int:
+    """
+    Write frames as a numbered image sequence by piping raw BGR data into FFmpeg.
+
+    A single FFmpeg process encodes all frames with its own (multi-threaded) encoders,
+    so there is no per-frame encode call or file handling in Python.
+
+    Args:
+        frames (Iterator[np.ndarray]): BGR frames to save.
+        rotation (Optional[int]): cv2.rotate code, or None for no rotation.
+        output_folder (str): Path to save frames.
+        ext (str): Output extension, "jpg" or "png".
+        jpeg_quality (int): JPEG quality 1..100.
+        png_compression (int): PNG compression 0..9.
+
+    Returns:
+        int: Number of frames saved.
+    """
+    if shutil.which("ffmpeg") is None:
+        print("Error: The 'ffmpeg' writer requires FFmpeg on the PATH")
+        sys.exit(1)
+
+    proc = None
+    saved_count = 0
+    try:
+        for frame in frames:
+            if rotation is not None:
+                frame = cv2.rotate(frame, rotation)
+            if proc is None:
+                # The frame size is only known once the first frame has been decoded.
+                height, width = frame.shape[:2]
+                proc = subprocess.Popen(
+                    [
+                        "ffmpeg", "-y", "-loglevel", "error",
+                        "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}",
+                        "-i", "-",
+                        *_ffmpeg_quality_args(ext, jpeg_quality, png_compression),
+                        "-start_number", "0",
+                        os.path.join(output_folder, f"frame_%06d.{ext}"),
+                    ],
+                    stdin=subprocess.PIPE,
+                )
+            proc.stdin.write(np.ascontiguousarray(frame).data)
+            saved_count += 1
+    finally:
+        if proc is not None:
+            proc.stdin.close()
+            proc.wait()
+
+    if proc is not None and proc.returncode != 0:
+        print("Error: FFmpeg failed to write the frames")
+        sys.exit(1)
+    return saved_count
+
+
+def _write_npy_header(f, frame_shape: Tuple[int, ...], count: int) -> None:
+    """
+    Write the .npy header for count uint8 frames at the start of an open file.
+
+    NumPy pads the header so the first dimension can grow without changing the
+    header size, so this can be called once with a placeholder count and again
+    with the real count after the frame data has been written.
+
+    Args:
+        f: File opened for binary writing; its position is moved to the end of the header.
+        frame_shape (Tuple[int, ...]): Shape of a single frame.
+        count (int): Number of frames.
+    """
+    f.seek(0)
+    np.lib.format.write_array_header_1_0(
+        f,
+        {"descr": np.lib.format.dtype_to_descr(np.dtype(np.uint8)),
+         "fortran_order": False,
+         "shape": (count,) + tuple(frame_shape)},
+    )
+
+
+def _save_frames_npy(frames: Iterator[np.ndarray], rotation: Optional[int], path: str) -> int:
+    """
+    Store frames uncompressed in a single .npy file.
+
+    There is no encoding and no per-frame file; the raw frames are appended one
+    after the other, and the header is finalized once the number of frames is
+    known (the container's frame count is only an estimate).
+
+    Args:
+        frames (Iterator[np.ndarray]): BGR frames to save.
+        rotation (Optional[int]): cv2.rotate code, or None for no rotation.
+        path (str): Output .npy path.
+
+    Returns:
+        int: Number of frames saved.
+    """
+    try:
+        # The file is only created once the first frame has been decoded, so a video
+        # that cannot be opened leaves nothing behind.
+        rotated = frames if rotation is None else (cv2.rotate(frame, rotation) for frame in frames)
+        first = next(rotated, None)
+        if first is None:
+            np.save(path, np.empty((0, 0, 0, 3), dtype=np.uint8))
+            return 0
+        frame_shape = first.shape
+        saved_count = 0
+        try:
+            with open(path, "wb") as f:
+                _write_npy_header(f, frame_shape, 0)
+                header_size = f.tell()
+                for frame in chain((first,), rotated):
+                    if frame.shape != frame_shape:
+                        raise ValueError(f"Frame {saved_count} has shape {frame.shape}, expected {frame_shape}")
+                    f.write(np.ascontiguousarray(frame).data)
+                    saved_count += 1
+                _write_npy_header(f, frame_shape, saved_count)
+                if f.tell() != header_size:
+                    raise RuntimeError(f"Could not finalize the header of {path}")
+        except BaseException:
+            # Do not leave a partial array behind
+            os.remove(path)
+            raise
+    finally:
+        frames.close()
+    return saved_count
+
+
+def _iter_frames_cv2(video_path: str, step: int) -> Iterator[np.ndarray]:
+    """
+    Yield every Nth frame of a video decoded with OpenCV.
+
+    Uses VideoCapture.grab() to skip frames cheaply and retrieve() only when needed.
+
+    Args:
+        video_path (str): Path to the video file.
+        step (int): Yield every Nth frame (>=1).
+
+    Yields:
+        np.ndarray: BGR frame. The buffer may be reused by OpenCV for the next frame.
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        print("Error: Could not open the video file")
+        sys.exit(1)
+
+    frame_idx = 0
+    try:
+        while True:
+            grabbed = cap.grab()
+            if not grabbed:
+                break
+
+            if frame_idx % step == 0:
+                ok, frame = cap.retrieve()
+                if not ok:
+                    break
+                yield frame
+
+            frame_idx += 1
+    finally:
+        cap.release()
+
+
+def _iter_frames_pyav(video_path: str, step: int) -> Iterator[np.ndarray]:
+    """
+    Yield every Nth frame of a video decoded with PyAV.
+
+    The decoder runs multi-threaded, and skipped frames are never converted to BGR.
+
+    Args:
+        video_path (str): Path to the video file.
+        step (int): Yield every Nth frame (>=1).
+
+    Yields:
+        np.ndarray: BGR frame.
+    """
+    try:
+        import av  # noqa: WPS433 (optional dependency)
+    except ImportError:
+        print("Error: The 'pyav' engine requires PyAV (pip install av)")
+        sys.exit(1)
+
+    try:
+        container = av.open(video_path)
+    except av.error.FFmpegError:
+        print("Error: Could not open the video file")
+        sys.exit(1)
+
+    try:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        for frame_idx, frame in enumerate(container.decode(stream)):
+            if frame_idx % step == 0:
+                yield frame.to_ndarray(format="bgr24")
+    finally:
+        container.close()
+
+
+def _write_worker(
+    jobs: "Queue[Optional[Tuple[str, np.ndarray]]]",
+    write_frame: Callable[[str, np.ndarray], None],
+    errors: List[BaseException],
+) -> None:
+    """
+    Write queued (filename, frame) jobs until the None sentinel is received.
+
+    Args:
+        jobs (Queue): Queue of (filename, frame) tuples, terminated by None.
+        write_frame (Callable[[str, np.ndarray], None]): Function encoding and writing one frame.
+        errors (List[BaseException]): Collects exceptions raised while writing.
+    """
+    while (job := jobs.get()) is not None:
+        try:
+            write_frame(*job)
+        except Exception as e:  # re-raised by extract_frames once all workers are done
+            errors.append(e)
+
+
+def _write_frames_python(
+    frames: Iterator[np.ndarray],
+    rotation: Optional[int],
+    output_folder: str,
+    ext: str,
+    jpeg_quality: int,
+    png_compression: int,
+    threads: int,
+    frames_owned: bool,
+) -> int:
+    """
+    Encode and write each frame as a numbered image file from Python.
+
+    With threads > 0 the frames are handed to persistent writer threads through
+    a bounded queue; otherwise they are written synchronously.
+
+    Args:
+        frames (Iterator[np.ndarray]): BGR frames to save.
+        rotation (Optional[int]): cv2.rotate code, or None for no rotation.
+        output_folder (str): Path to save frames.
+        ext (str): Output extension, "jpg" or "png".
+        jpeg_quality (int): JPEG quality 1..100.
+        png_compression (int): PNG compression 0..9.
+        threads (int): Number of writer threads (0 = synchronous).
+        frames_owned (bool): True if every frame is a new array (PyAV); OpenCV may
+            reuse its buffer, so its frames are copied before being queued.
+
+    Returns:
+        int: Number of frames saved.
+    """
+    write_frame = _make_frame_writer(ext, jpeg_quality, png_compression)
+    saved_count = 0
+    # Join the folder once; braces in it are escaped so only the counter is formatted.
+    folder = output_folder.replace("{", "{{").replace("}", "}}")
+    filename_template = os.path.join(folder, f"frame_{{:06d}}.{ext}")
+
+    # Decoding runs ahead of the writer threads by at most a few frames; the bounded
+    # queue blocks the decoder when encoding is slower, keeping memory use flat.
+    jobs = Queue(maxsize=2 * threads) if threads > 0 else None
+    errors: List[BaseException] = []
+    workers = [
+        Thread(target=_write_worker, args=(jobs, write_frame, errors), daemon=True)
+        for _ in range(max(threads, 0))
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for frame in frames:
+            owned = frames_owned
+            if rotation is not None:
+                frame = cv2.rotate(frame, rotation)
+                # The rotated frame is a new array that nothing else references.
+                owned = True
+
+            filename = filename_template.format(saved_count)
+            if jobs is not None:
+                # Copy to decouple from buffer reused by OpenCV.
+                jobs.put((filename, frame if owned else frame.copy()))
+            else:
+                write_frame(filename, frame)
+            saved_count += 1
+    finally:
+        frames.close()
+        for _ in workers:
+            jobs.put(None)
+        for worker in workers:
+            worker.join()
+
+    if errors:
+        raise errors[0]
+    return saved_count
+
+
 def extract_frames(
     video_path: str,
     output_folder: str,
@@ -104,21 +514,25 @@ def extract_frames(
     jpeg_quality: int = 92,
     png_compression: int = 1,
     threads: int = 0,
+    engine: str = "cv2",
+    writer: str = "python",
 ) -> int:
     """
     Extract frames from the specified video, rotating and saving only every Nth frame.
 
-    Uses VideoCapture.grab() to skip frames cheaply and retrieve() only when needed.
-
     Args:
         video_path (str): Path to the MP4 video file.
         output_folder (str): Path to save frames.
         step (int): Save every Nth frame (>=1).
         rotate (int): Rotation in degrees; positive = clockwise, negative = counter-clockwise.
-        ext (str): Output extension, "jpg" or "png".
+        ext (str): Output extension, "jpg" or "png", or "raw" for a single frames.npy
+            array (threads and writer are then ignored).
         jpeg_quality (int): JPEG quality 1..100.
         png_compression (int): PNG compression 0..9.
         threads (int): Number of writer threads (0 = synchronous).
+        engine (str): Decoding engine, "cv2" or "pyav".
+        writer (str): "python" to encode each image from Python, "ffmpeg" to pipe the
+            frames into a single FFmpeg process (threads is then ignored).
 
     Returns:
         int: Number of frames saved.
@@ -129,11 +543,6 @@ def extract_frames(
 
     os.makedirs(output_folder, exist_ok=True)
 
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        print("Error: Could not open the video file")
-        sys.exit(1)
-
     rotation_map = {
         90: cv2.ROTATE_90_CLOCKWISE,
         -270: cv2.ROTATE_90_CLOCKWISE,
@@ -144,45 +553,33 @@ def extract_frames(
     }
 
     step = max(1, int(step))
-    params = _imwrite_params(ext, jpeg_quality, png_compression)
+    frames = _iter_frames_pyav(video_path, step) if engine == "pyav" else _iter_frames_cv2(video_path, step)
 
-    saved_count = 0
-    frame_idx = 0
+    if ext == "raw":
+        return _save_frames_npy(
+            frames,
+            rotation_map.get(rotate),
+            os.path.join(output_folder, "frames.npy"),
+        )
 
-    executor = ThreadPoolExecutor(max_workers=threads) if threads > 0 else None
-    pending = []
+    if writer == "ffmpeg":
+        try:
+            return _pipe_frames_to_ffmpeg(
+                frames, rotation_map.get(rotate), output_folder, ext, jpeg_quality, png_compression
+            )
+        finally:
+            frames.close()
 
-    try:
-        while True:
-            grabbed = cap.grab()
-            if not grabbed:
-                break
-
-            if frame_idx % step == 0:
-                ok, frame = cap.retrieve()
-                if not ok:
-                    break
-
-                if rotate in rotation_map:
-                    frame = cv2.rotate(frame, rotation_map[rotate])
-
-                filename = os.path.join(output_folder, f"frame_{saved_count:06d}.{ext}")
-                if executor is not None:
-                    # Copy to decouple from buffer reused by OpenCV.
-                    pending.append(executor.submit(cv2.imwrite, filename, frame.copy(), params))
-                else:
-                    cv2.imwrite(filename, frame, params)
-                saved_count += 1
-
-            frame_idx += 1
-    finally:
-        cap.release()
-        if executor is not None:
-            for f in pending:
-                f.result()
-            executor.shutdown(wait=True)
-
-    return saved_count
+    return _write_frames_python(
+        frames,
+        rotation_map.get(rotate),
+        output_folder,
+        ext,
+        jpeg_quality,
+        png_compression,
+        threads,
+        frames_owned=engine == "pyav",
+    )
 
 
 def main() -> None:
@@ -197,6 +594,8 @@ def main() -> None:
         args.jpeg_quality,
         args.png_compression,
         args.threads,
+        args.engine,
+        args.writer,
     )
     print(f"Extracted {count} frames to '{args.output_folder}'.")
     
@@ -6,25 +6,113 @@ This script converts each page of a given PDF file into a PNG image.
 Each page is saved as a separate PNG file (1.png, 2.png, ...).
 The PNGs are stored in a new folder with the same name as the PDF file
 (without extension), located next to the input PDF.
+Pages are rendered in parallel worker processes, one per CPU core.
 
 Usage:
-    python pdf_to_png.py input.pdf [dpi]
+    python pdf_to_png.py input.pdf [dpi] [--png-level L] [--format {png,ppm}]
     - input.pdf: Path to the PDF file.
     - dpi (optional): Desired resolution in DPI (default: 150).
+    - --png-level (optional): zlib level 0..9 for the PNGs, encoded via Pillow.
+      By default MuPDF's own PNG encoder is used.
+    - --format (optional): "ppm" writes uncompressed images (1.ppm, ...), which is
+      much faster when the images are only an intermediate step.
 """
 
-import sys
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Optional
 import fitz  # PyMuPDF
 
 
-def pdf_to_png(pdf_path: str, dpi: int = 150) -> None:
+# Document handle of a worker process, opened once by _open_worker_document
+_worker_doc = None
+
+
+def _open_worker_document(pdf_path: str) -> None:
+    """
+    Open the PDF once per worker process, so pages can be dispatched one at a time.
+
+    Args:
+        pdf_path (str): Path to the input PDF file.
+    """
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _render_page(
+    doc: fitz.Document,
+    index: int,
+    zoom: float,
+    output_dir: str,
+    fmt: str = "png",
+    png_level: Optional[int] = None,
+) -> str:
+    """
+    Render one page of a PDF into an image file.
+
+    Args:
+        doc (fitz.Document): Open PDF document.
+        index (int): Zero-based index of the page to render.
+        zoom (float): Scale factor relative to 72 DPI.
+        output_dir (str): Folder to write the "<page number>.<fmt>" file into.
+        fmt (str): Output format, "png" or "ppm".
+        png_level (Optional[int]): zlib level for PNGs via Pillow; None uses MuPDF's encoder.
+
+    Returns:
+        str: Path of the written file.
+    """
+    pix = doc[index].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    output_file = os.path.join(output_dir, f"{index + 1}.{fmt}")
+    if fmt == "png" and png_level is not None:
+        pix.pil_save(output_file, format="PNG", compress_level=png_level)
+    else:
+        pix.save(output_file)
+    return output_file
+
+
+def _render_page_in_worker(
+    index: int,
+    zoom: float,
+    output_dir: str,
+    fmt: str = "png",
+    png_level: Optional[int] = None,
+) -> str:
+    """
+    Render one page with the document opened by _open_worker_document.
+
+    Args:
+        index (int): Zero-based index of the page to render.
+        zoom (float): Scale factor relative to 72 DPI.
+        output_dir (str): Folder to write the "<page number>.<fmt>" file into.
+        fmt (str): Output format, "png" or "ppm".
+        png_level (Optional[int]): zlib level for PNGs via Pillow; None uses MuPDF's encoder.
+
+    Returns:
+        str: Path of the written file.
+    """
+    return _render_page(_worker_doc, index, zoom, output_dir, fmt, png_level)
+
+
+def pdf_to_png(
+    pdf_path: str,
+    dpi: int = 150,
+    jobs: int = 0,
+    fmt: str = "png",
+    png_level: Optional[int] = None,
+) -> None:
     """
     Convert a PDF into PNG images, one image per page.
 
     Args:
         pdf_path (str): Path to the input PDF file.
         dpi (int): Resolution in DPI. Default is 150.
+        jobs (int): Number of worker processes; 0 means one per CPU core. Default is 0.
+        fmt (str): Output format, "png" or "ppm" (uncompressed). Default is "png".
+        png_level (Optional[int]): zlib level 0..9 for PNGs, encoded via Pillow.
+            Default is None, which uses MuPDF's own PNG encoder.
     """
     pdf_file = Path(pdf_path)
     if not pdf_file.is_file():
@@ -34,22 +122,58 @@ def pdf_to_png(pdf_path: str, dpi: int = 150) -> None:
     output_dir.mkdir(exist_ok=True)
 
     zoom = dpi / 72  # 72 DPI is the default resolution in PDFs
-    mat = fitz.Matrix(zoom, zoom)
 
-    doc = fitz.open(str(pdf_file))
-    for i, page in enumerate(doc, start=1):
-        pix = page.get_pixmap(matrix=mat)
-        output_file = output_dir / f"{i}.png"
-        pix.save(str(output_file))
-        print(f"Saved {output_file} at {dpi} DPI")
-    doc.close()
+    with fitz.open(str(pdf_file)) as doc:
+        page_count = doc.page_count
+        workers = max(1, min(jobs or os.cpu_count() or 1, page_count))
+        if workers == 1:
+            for i in range(page_count):
+                output_file = _render_page(doc, i, zoom, str(output_dir), fmt, png_level)
+                print(f"Saved {output_file} at {dpi} DPI")
+            return
 
+    # Every worker opens the document once; pages are handed out one at a time, which
+    # balances simple and complex pages and reports each page as soon as it is saved.
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_open_worker_document, initargs=(str(pdf_file),)
+    ) as executor:
+        for output_file in executor.map(
+            _render_page_in_worker,
+            range(page_count),
+            repeat(zoom),
+            repeat(str(output_dir)),
+            repeat(fmt),
+            repeat(png_level),
+        ):
+            print(f"Saved {output_file} at {dpi} DPI")
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2 or len(sys.argv) > 3:
-        print("Usage: python pdf_to_png.py input.pdf [dpi]")
-        sys.exit(1)
 
-    input_pdf = sys.argv[1]
-    dpi = int(sys.argv[2]) if len(sys.argv) == 3 else 150
-    pdf_to_png(input_pdf, dpi)
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Convert each page of a PDF into a PNG image.")
+    parser.add_argument("input_pdf", help="Path to the PDF file")
+    parser.add_argument("dpi", nargs="?", type=int, default=150, help="Resolution in DPI (default: 150)")
+    parser.add_argument(
+        "--png-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        help="zlib compression level 0..9 for the PNGs via Pillow (default: MuPDF's encoder).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["png", "ppm"],
+        default="png",
+        help="Output format (default: png). ppm is uncompressed and fastest to write.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    pdf_to_png(args.input_pdf, args.dpi, fmt=args.format, png_level=args.png_level)
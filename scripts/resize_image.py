@@ -4,6 +4,9 @@ Resize images to fit within Full HD (1920x1080) resolution while maintaining asp
 
 Usage:
     python resize_image.py <input_path> <output_path>
+
+The Lanczos resize is several times faster with the source-compatible Pillow-SIMD
+fork (pip uninstall pillow && CC="cc -mavx2" pip install pillow-simd).
 """
 
 import argparse
@@ -22,7 +25,9 @@ def resize_image(input_path, output_path, max_width=1920, max_height=1080):
         max_height (int): Maximum height of the resized image.
     """
     img = Image.open(input_path)
-    img.thumbnail((max_width, max_height), Image.ANTIALIAS)
+    # thumbnail() first calls draft(), so JPEGs are already decoded at a reduced
+    # DCT scale (with a quality margin) before the Lanczos pass
+    img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
     img.save(output_path)
 
 
@@ -6,20 +6,133 @@ Usage:
 """
 
 import cv2
+import numpy as np
 from cv_bridge import CvBridge
 from sensor_msgs.msg import Image
 import rclpy
 from rclpy.node import Node
 
 
+DISPLAY_RATE_HZ = 30.0
+WINDOW_TITLE = "Camera Image"
+
+VERTEX_SHADER = """
+#version 330
+in vec2 in_pos;
+in vec2 in_uv;
+out vec2 uv;
+void main() {
+    uv = in_uv;
+    gl_Position = vec4(in_pos, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+uniform sampler2D image;
+in vec2 uv;
+out vec4 color;
+void main() {
+    color = vec4(texture(image, uv).bgr, 1.0);
+}
+"""
+
+
+class GlDisplay:
+    """
+    Minimal glfw/moderngl window that shows BGR frames as a fullscreen texture.
+
+    The texture is allocated once per frame size and only re-uploaded per frame,
+    so the BGR to RGB swap happens in the fragment shader instead of on the CPU.
+    """
+
+    def __init__(self, title):
+        """
+        Create the window, GL context and fullscreen quad.
+
+        Args:
+            title (str): Window title.
+
+        Raises:
+            ImportError: If moderngl or glfw is not installed.
+            RuntimeError: If no window or GL context can be created.
+        """
+        import glfw
+        import moderngl
+
+        if not glfw.init():
+            raise RuntimeError("glfw initialization failed")
+        window = glfw.create_window(640, 480, title, None, None)
+        if not window:
+            glfw.terminate()
+            raise RuntimeError("glfw could not create a window")
+        glfw.make_context_current(window)
+        glfw.swap_interval(0)
+        try:
+            ctx = moderngl.create_context()
+        except Exception as exc:
+            glfw.terminate()
+            raise RuntimeError(f"OpenGL context creation failed: {exc}") from exc
+
+        self.glfw = glfw
+        self.moderngl = moderngl
+        self.window = window
+        self.ctx = ctx
+        program = ctx.program(vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER)
+        # x, y, u, v for a triangle strip; v = 0 is the first image row (top).
+        quad = np.array(
+            [-1.0, -1.0, 0.0, 1.0,
+             1.0, -1.0, 1.0, 1.0,
+             -1.0, 1.0, 0.0, 0.0,
+             1.0, 1.0, 1.0, 0.0],
+            dtype="f4",
+        )
+        self.vao = ctx.vertex_array(
+            program, [(ctx.buffer(quad.tobytes()), "2f 2f", "in_pos", "in_uv")]
+        )
+        self.texture = None
+
+    def show(self, frame):
+        """
+        Upload a frame into the texture and draw it.
+
+        Args:
+            frame (numpy.ndarray): HxWx3 uint8 BGR image.
+        """
+        height, width = frame.shape[:2]
+        if self.texture is None or self.texture.size != (width, height):
+            if self.texture is not None:
+                self.texture.release()
+            self.texture = self.ctx.texture((width, height), 3)
+            self.glfw.set_window_size(self.window, width, height)
+        self.texture.write(np.ascontiguousarray(frame))
+        self.texture.use(0)
+        self.ctx.viewport = (0, 0) + tuple(self.glfw.get_framebuffer_size(self.window))
+        self.vao.render(self.moderngl.TRIANGLE_STRIP)
+        self.glfw.swap_buffers(self.window)
+
+    def poll_events(self):
+        """
+        Process pending window events, keeping the window responsive.
+        """
+        self.glfw.poll_events()
+
+    def close(self):
+        """
+        Destroy the window and release glfw.
+        """
+        self.glfw.destroy_window(self.window)
+        self.glfw.terminate()
+
+
 class ImageConverter(Node):
     """
-    A ROS 2 node that subscribes to sensor_msgs/Image messages and displays them using OpenCV.
+    A ROS 2 node that subscribes to sensor_msgs/Image messages and displays them.
     """
 
     def __init__(self):
         """
-        Initialize the image converter node, subscription, and CvBridge.
+        Initialize the image converter node, subscription, display timer, and CvBridge.
         """
         super().__init__("image_converter")
         self.subscription = self.create_subscription(
@@ -29,17 +142,77 @@ class ImageConverter(Node):
             10
         )
         self.bridge = CvBridge()
+        self.latest = None
+        self.new_frame = False
+        try:
+            self.gl_display = GlDisplay(WINDOW_TITLE)
+        except (ImportError, RuntimeError) as exc:
+            self.get_logger().info(f"OpenGL display unavailable, using cv2.imshow: {exc}")
+            self.gl_display = None
+        self.display_timer = self.create_timer(1.0 / DISPLAY_RATE_HZ, self.draw)
+
+    @staticmethod
+    def bgr8_view(msg):
+        """
+        Wrap the buffer of a bgr8 image message as a numpy array without copying it.
+
+        Row padding (msg.step larger than width * 3) is skipped via strides.
+
+        Args:
+            msg (sensor_msgs.msg.Image): Image message with "bgr8" encoding.
+
+        Returns:
+            numpy.ndarray: HxWx3 view onto the message data.
+        """
+        data = np.frombuffer(msg.data, dtype=np.uint8)
+        row_bytes = msg.width * 3
+        if msg.step == row_bytes:
+            return data.reshape(msg.height, msg.width, 3)
+        rows = data[: msg.height * msg.step].reshape(msg.height, msg.step)
+        return rows[:, :row_bytes].reshape(msg.height, msg.width, 3)
 
     def image_callback(self, msg):
         """
-        Callback function to convert ROS2 image message to OpenCV format and display it.
+        Callback function to convert ROS2 image message to OpenCV format.
+
+        bgr8 messages are kept as a view of the message buffer; other
+        encodings are converted with CvBridge. Only the newest frame is kept,
+        drawing happens in the display timer.
 
         Args:
             msg (sensor_msgs.msg.Image): The incoming image message.
         """
-        cv_image = self.bridge.imgmsg_to_cv2(msg, desired_encoding="bgr8")
-        cv2.imshow("Camera Image", cv_image)
-        cv2.waitKey(1)
+        if msg.encoding == "bgr8":
+            self.latest = self.bgr8_view(msg)
+        else:
+            self.latest = self.bridge.imgmsg_to_cv2(msg, desired_encoding="bgr8")
+        self.new_frame = True
+
+    def draw(self):
+        """
+        Display the newest received frame at a fixed rate if it has not been shown yet.
+
+        Window events are processed on every tick, also while no new frame arrives.
+        """
+        if self.new_frame:
+            self.new_frame = False
+            if self.gl_display is not None:
+                self.gl_display.show(self.latest)
+            else:
+                cv2.imshow(WINDOW_TITLE, self.latest)
+        if self.gl_display is not None:
+            self.gl_display.poll_events()
+        else:
+            cv2.waitKey(1)
+
+    def close_display(self):
+        """
+        Close whichever display window is in use.
+        """
+        if self.gl_display is not None:
+            self.gl_display.close()
+        else:
+            cv2.destroyAllWindows()
 
 
 def main(args=None):
@@ -54,7 +227,7 @@ def main(args=None):
     except KeyboardInterrupt:
         pass
     finally:
-        cv2.destroyAllWindows()
+        node.close_display()
         node.destroy_node()
         rclpy.shutdown()
 